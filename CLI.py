@@ -2,7 +2,10 @@ import argparse
 
 from Character import CharacterManager
 from CharacterBuilder import CharacterBuilder
+from EncounterSimulator import EncounterSimulator, format_results
 from Item import Item
+from MemoryProfiler import MemoryProfiler, format_report
+from StatRoller import STATS, StatRoller
 
 
 def build_character():
@@ -41,16 +44,32 @@ def build_character():
     builder = CharacterBuilder()
     builder.set_name(name).set_class(char_class)
 
-    stats = {}
-    for stat in ["STR", "DEX", "CON", "INT", "WIS", "CHA"]:
-        stat_val = input(f"{stat} (enter to skip): ")
+    while True:
+        stat_method = (
+            input(
+                f"Roll stats? ({'/'.join(StatRoller.METHODS)}, enter to type them in): "
+            )
+            .strip()
+            .lower()
+        )
+        if not stat_method or stat_method in StatRoller.METHODS:
+            break
+        print(f"Invalid choice! Expected one of: {', '.join(StatRoller.METHODS)}")
 
-        if not stat_val:
-            continue
-        if stat_val.isdigit() and int(stat_val) > 0:
-            stats[stat] = int(stat_val)
-        else:
-            print("Invalid input! Please enter a positive whole number.")
+    stats = {}
+    if stat_method:
+        stats = StatRoller().roll_one(stat_method)
+        print(f"Rolled stats: {stats}")
+    else:
+        for stat in STATS:
+            stat_val = input(f"{stat} (enter to skip): ")
+
+            if not stat_val:
+                continue
+            if stat_val.isdigit() and int(stat_val) > 0:
+                stats[stat] = int(stat_val)
+            else:
+                print("Invalid input! Please enter a positive whole number.")
     builder.set_stats(stats)
 
     add_items = input("Add item(s)? (y/[d]efault/n): ").strip().lower()
@@ -90,6 +109,20 @@ def build_character():
     return builder.build()
 
 
+def positive_int(value: str) -> int:
+    """
+    Argparse type for options that must be a whole number above zero.
+
+    :param str value: the raw command line value.
+    :return int: the parsed value.
+    """
+    if not value.isdigit() or int(value) < 1:
+        raise argparse.ArgumentTypeError(
+            f"expected a positive whole number, got {value}"
+        )
+    return int(value)
+
+
 def prompt_mode():
     """
     Ask the user to choose between loading or building characters.
@@ -117,8 +150,55 @@ def main():
         default="characters.json",
         help="Path to JSON file for saving/loading characters.",
     )
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="Load the characters in FILE and report their memory footprint.",
+    )
+    parser.add_argument(
+        "--simulate",
+        nargs=2,
+        metavar=("FILE_A", "FILE_B"),
+        help="Simulate encounters between the characters in FILE_A and FILE_B.",
+    )
+    parser.add_argument(
+        "--trials",
+        type=positive_int,
+        default=1000,
+        help="Number of encounters to simulate.",
+    )
+    parser.add_argument("--seed", type=int, help="Seed for reproducible simulations.")
+    parser.add_argument(
+        "--workers", type=positive_int, help="Worker processes (default: CPU count)."
+    )
     args = parser.parse_args()
 
+    if args.simulate:
+        try:
+            party_a, party_b = (
+                CharacterManager.load_characters(file_name)
+                for file_name in args.simulate
+            )
+            simulator = EncounterSimulator(party_a, party_b)
+            results = simulator.run(args.trials, args.seed, args.workers)
+        except FileNotFoundError as e:
+            print(e)
+            return
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        print(format_results(results))
+        return
+
+    if args.profile:
+        try:
+            report = MemoryProfiler().profile_file(args.profile)
+        except FileNotFoundError:
+            print(f"Error: File '{args.profile}' not found.")
+            return
+        print(format_report(report))
+        return
+
     mode = prompt_mode()
 
     if mode == "build":
@@ -75,6 +75,23 @@ class Character(abc.ABC):  # Abstraction - abstract class Character
         if item in self._inventory:
             self._inventory.remove(item)
 
+    def copy(self) -> "Character":
+        """
+        Creates an independent copy of the character: its stats, inventory and
+        items are new objects, so changing one never affects the other.
+        Much cheaper than copy.deepcopy.
+
+        :return Character: the copy, of the same class as the original.
+        """
+        copied = object.__new__(type(self))
+        copied.__dict__.update(vars(self))
+        copied.stats = dict(self.stats)
+        copied._inventory = [
+            Item(item.name, item.description, item.value) for item in self._inventory
+        ]
+
+        return copied
+
     def to_dict(self) -> dict:
         """
         Converts the character object into a dictionary representation
@@ -83,6 +100,7 @@ class Character(abc.ABC):  # Abstraction - abstract class Character
         param: name (str): The character's name
         param: character_class (str): The class of the character (e.g., Barbarian)
         param: stats (dict): A dictionary of the character's stats (e.g. STR)
+        param: health (int): The character's health
         param: inventory (list): A list of item names representing the character's inventory.
 
         """
@@ -90,6 +108,7 @@ class Character(abc.ABC):  # Abstraction - abstract class Character
             "name": self._name,
             "character_class": self._character_class,
             "stats": self.stats,
+            "health": self.health,
             "inventory": [item.__dict__ for item in self._inventory],
         }
 
@@ -334,12 +353,33 @@ class CharacterManager:
             print(f"Error writing to {output_file}: {e}")
 
     @staticmethod
-    def load_characters(json_file):
+    def load_characters(json_file, cache=None):
         """
         Loads characters from a JSON file and reconstructs them.
         Reads character data from the provided JSON file and recreates Character
         objects using the CharacterBuilder class.
 
+        :param str json_file: the file path of the JSON file containing Character data.
+        :param CharacterCache cache: optional cache to reuse characters from unchanged files.
+        :return: A list of Character objects reconstructed from stored data.
+        """
+        try:
+            if cache is not None:
+                return cache.get_or_load(json_file, CharacterManager._read_characters)
+
+            return CharacterManager._read_characters(json_file)
+
+        except json.JSONDecodeError:
+            print(f"Error: Invalid JSON format in {json_file}")
+
+        return []
+
+    @staticmethod
+    def _read_characters(json_file):
+        """
+        Reads and parses a JSON file of characters without any caching.
+        Invalid JSON raises json.JSONDecodeError, so a cache never stores a failed load.
+
         :param str json_file: the file path of the JSON file containing Character data.
         :return: A list of Character objects reconstructed from stored data.
         """
@@ -358,6 +398,9 @@ class CharacterManager:
                     if "stats" in char_data:
                         builder.set_stats(char_data.get("stats", {}))
 
+                    if "health" in char_data:
+                        builder.set_health(char_data["health"])
+
                     if "inventory" in char_data:
                         item_dicts = char_data["inventory"]
                         items = [Item(**item_data) for item_data in item_dicts]
@@ -368,7 +411,4 @@ class CharacterManager:
         except FileNotFoundError:
             raise FileNotFoundError(f"Error: {json_file} not found.")
 
-        except json.JSONDecodeError:
-            print(f"Error: Invalid JSON format in {json_file}")
-
         return characters
@@ -16,6 +16,21 @@ from Character import (
     Wizard,
 )
 
+CHAR_CLASS_MAP = {
+    "Barbarian": Barbarian,
+    "Bard": Bard,
+    "Cleric": Cleric,
+    "Druid": Druid,
+    "Fighter": Fighter,
+    "Monk": Monk,
+    "Paladin": Paladin,
+    "Ranger": Ranger,
+    "Rogue": Rogue,
+    "Sorcerer": Sorcerer,
+    "Warlock": Warlock,
+    "Wizard": Wizard,
+}
+
 
 class CharacterBuilder:
     """
@@ -48,27 +63,12 @@ class CharacterBuilder:
         :param str char_class: The class of the character (e.g., Barbarian).
         :return CharacterBuilder: Returns the builder for chaining.
         """
-        char_class_map = {
-            "Barbarian": Barbarian,
-            "Bard": Bard,
-            "Cleric": Cleric,
-            "Druid": Druid,
-            "Fighter": Fighter,
-            "Monk": Monk,
-            "Paladin": Paladin,
-            "Ranger": Ranger,
-            "Rogue": Rogue,
-            "Sorcerer": Sorcerer,
-            "Warlock": Warlock,
-            "Wizard": Wizard,
-        }
-
-        if char_class in char_class_map:
-            self.character = char_class_map[char_class](
+        if char_class in CHAR_CLASS_MAP:
+            self.character = CHAR_CLASS_MAP[char_class](
                 name=self.name or "Unnamed", stats={}
             )
 
-        if char_class not in char_class_map:
+        if char_class not in CHAR_CLASS_MAP:
             raise ValueError(f"Unsupported character class: {char_class}")
 
         return self
@@ -90,6 +90,18 @@ class CharacterBuilder:
 
         return self
 
+    def set_health(self, health: int) -> CharacterBuilder:
+        """
+        Sets the character's health.
+
+        :param int health: The health of the character.
+        :return CharacterBuilder: Returns the builder for chaining.
+        """
+        if self.character:
+            self.character.health = health
+
+        return self
+
     def set_inventory(self, items: list) -> CharacterBuilder:
         """
         Sets the character's inventory.
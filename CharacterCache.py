@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+from MemoryProfiler import MemoryProfiler
+
+_SIZE_SAMPLE = 16
+
+
+class CharacterCache:
+    """
+    Bounded LRU cache for characters loaded from JSON files.
+    Entries are keyed by the file's identity (path, mtime, size, inode), so an
+    edited or replaced file is never served stale. Entries are evicted in
+    least-recently-used order once either the entry limit or the approximate
+    memory budget is exceeded.
+
+    Every hit returns fresh copies of the cached characters (new stats dict,
+    inventory list and items), so callers can freely modify what they get back
+    without corrupting the cache.
+
+    :param int max_entries: The maximum number of files kept in the cache.
+    :param int max_bytes: The approximate memory budget for all entries.
+    """
+
+    def __init__(self, max_entries: int = 32, max_bytes: int = 16 * 1024 * 1024):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (characters, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def file_key(json_file) -> tuple:
+        """
+        Builds the cache key identifying the current contents of a file.
+
+        :param str json_file: the file path of the JSON file.
+        :return tuple: (absolute path, mtime in ns, size, inode).
+        """
+        info = os.stat(json_file)
+        return (
+            os.path.abspath(json_file),
+            info.st_mtime_ns,
+            info.st_size,
+            info.st_ino,
+        )
+
+    def get_or_load(self, json_file, loader) -> list:
+        """
+        Returns copies of the characters stored in json_file, calling loader
+        to read the file only when it is not already cached.
+
+        :param str json_file: the file path of the JSON file.
+        :param loader: a callable taking the file path and returning a list of characters.
+            If it raises, nothing is cached and the exception propagates.
+        :return: A list of Character objects owned by the caller.
+        """
+        try:
+            key = self.file_key(json_file)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Error: {json_file} not found.")
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return [char.copy() for char in entry[0]]
+            self.misses += 1
+
+        characters = loader(json_file)
+        self._store(key, [char.copy() for char in characters])
+
+        return characters
+
+    def _store(self, key: tuple, characters: list) -> None:
+        with self._lock:
+            # a file that changed on disk leaves its old keys behind; drop them
+            for stale in [k for k in self._entries if k[0] == key[0]]:
+                self._bytes -= self._entries.pop(stale)[1]
+
+        # walking every character costs about as much as loading them, so scale a sample
+        sample = characters[:_SIZE_SAMPLE]
+        size = sys.getsizeof(characters)
+        if sample:
+            sample_size = MemoryProfiler().profile_characters(sample)["total"]
+            size += sample_size * len(characters) // len(sample)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+
+            self._entries[key] = (characters, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache. Counters are left untouched.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """
+        Reports the cache counters and current usage.
+
+        :return dict: hits, misses, evictions, entries and approximate bytes.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+from collections.abc import MutableSequence
+from types import MappingProxyType
+
+from Character import Character
+
+
+class _Node:
+    """
+    An immutable node of a size-balanced AVL tree ordered by position.
+    Updates copy only the path from the root to the change, so every other
+    node is shared between the old and the new tree.
+    """
+
+    __slots__ = ("left", "item", "right", "size", "height")
+
+    def __init__(self, left, item, right):
+        self.left = left
+        self.item = item
+        self.right = right
+        self.size = _size(left) + 1 + _size(right)
+        self.height = max(_height(left), _height(right)) + 1
+
+
+def _size(node) -> int:
+    return node.size if node else 0
+
+
+def _height(node) -> int:
+    return node.height if node else 0
+
+
+def _balance(left, item, right) -> _Node:
+    """
+    Joins two subtrees whose heights differ by at most two into a balanced node.
+    """
+    if _height(left) > _height(right) + 1:
+        if _height(left.left) >= _height(left.right):
+            return _Node(left.left, left.item, _Node(left.right, item, right))
+        pivot = left.right
+        return _Node(
+            _Node(left.left, left.item, pivot.left),
+            pivot.item,
+            _Node(pivot.right, item, right),
+        )
+    if _height(right) > _height(left) + 1:
+        if _height(right.right) >= _height(right.left):
+            return _Node(_Node(left, item, right.left), right.item, right.right)
+        pivot = right.left
+        return _Node(
+            _Node(left, item, pivot.left),
+            pivot.item,
+            _Node(pivot.right, right.item, right.right),
+        )
+    return _Node(left, item, right)
+
+
+def _build(items: list, start: int, stop: int):
+    if start >= stop:
+        return None
+    middle = (start + stop) // 2
+    return _Node(
+        _build(items, start, middle), items[middle], _build(items, middle + 1, stop)
+    )
+
+
+def _get(node, index: int):
+    while node:
+        left_size = _size(node.left)
+        if index < left_size:
+            node = node.left
+        elif index == left_size:
+            return node.item
+        else:
+            index -= left_size + 1
+            node = node.right
+    raise IndexError("inventory index out of range")
+
+
+def _set(node, index: int, item) -> _Node:
+    left_size = _size(node.left)
+    if index < left_size:
+        return _Node(_set(node.left, index, item), node.item, node.right)
+    if index == left_size:
+        return _Node(node.left, item, node.right)
+    return _Node(node.left, node.item, _set(node.right, index - left_size - 1, item))
+
+
+def _insert(node, index: int, item) -> _Node:
+    if node is None:
+        return _Node(None, item, None)
+    left_size = _size(node.left)
+    if index <= left_size:
+        return _balance(_insert(node.left, index, item), node.item, node.right)
+    right = _insert(node.right, index - left_size - 1, item)
+    return _balance(node.left, node.item, right)
+
+
+def _pop_first(node) -> tuple:
+    if node.left is None:
+        return node.item, node.right
+    item, left = _pop_first(node.left)
+    return item, _balance(left, node.item, node.right)
+
+
+def _delete(node, index: int):
+    left_size = _size(node.left)
+    if index < left_size:
+        return _balance(_delete(node.left, index), node.item, node.right)
+    if index > left_size:
+        right = _delete(node.right, index - left_size - 1)
+        return _balance(node.left, node.item, right)
+    if node.right is None:
+        return node.left
+    item, right = _pop_first(node.right)
+    return _balance(node.left, item, right)
+
+
+def _nodes(node):
+    stack = [node] if node else []
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(child for child in (node.left, node.right) if child)
+
+
+def _iterate(node):
+    stack = []
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node.item
+        node = node.right
+
+
+class SharedInventory(MutableSequence):
+    """
+    A list-like inventory stored in a persistent tree.
+    Indexing, appending, inserting and deleting take O(log n) and never modify
+    existing tree nodes, so taking a snapshot of the inventory is just keeping
+    a reference to its current root.
+
+    :param items: the initial items.
+    """
+
+    def __init__(self, items=()):
+        items = list(items)
+        self._root = _build(items, 0, len(items))
+
+    @classmethod
+    def _from_root(cls, root) -> SharedInventory:
+        inventory = cls.__new__(cls)
+        inventory._root = root
+        return inventory
+
+    def _index(self, index: int) -> int:
+        size = _size(self._root)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("inventory index out of range")
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        return _get(self._root, self._index(index))
+
+    def __setitem__(self, index, item) -> None:
+        if isinstance(index, slice):
+            items = list(self)
+            items[index] = item
+            self._root = _build(items, 0, len(items))
+            return
+        self._root = _set(self._root, self._index(index), item)
+
+    def __delitem__(self, index) -> None:
+        if isinstance(index, slice):
+            items = list(self)
+            del items[index]
+            self._root = _build(items, 0, len(items))
+            return
+        self._root = _delete(self._root, self._index(index))
+
+    def __len__(self):
+        return _size(self._root)
+
+    def __iter__(self):
+        return _iterate(self._root)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, SharedInventory)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"SharedInventory({list(self)!r})"
+
+    def nodes(self):
+        """
+        Iterates the tree nodes holding the items, for memory accounting.
+        Nodes may be shared with snapshots and other inventories.
+        """
+        return _nodes(self._root)
+
+    def insert(self, index: int, item) -> None:
+        size = _size(self._root)
+        index = max(0, min(size, index + size if index < 0 else index))
+        self._root = _insert(self._root, index, item)
+
+    def index(self, item, start: int = 0, stop: int = None) -> int:
+        for position, candidate in enumerate(self):
+            if stop is not None and position >= stop:
+                break
+            if position >= start and (candidate is item or candidate == item):
+                return position
+        raise ValueError(f"{item!r} is not in inventory")
+
+
+class Snapshot:
+    """
+    A read-only version of a character's stats, health and inventory.
+    Items are shared with the live character and later versions rather than
+    copied, so they should be treated as values and replaced, not edited.
+    """
+
+    __slots__ = ("stats", "health", "_root")
+
+    def __init__(self, stats: MappingProxyType, health: int, root):
+        self.stats = stats
+        self.health = health
+        self._root = root
+
+    @property
+    def inventory(self) -> tuple:
+        """
+        :return tuple: the items held at the time of the snapshot.
+        """
+        return tuple(_iterate(self._root))
+
+
+class CharacterHistory:
+    """
+    Versioned undo history for a Character built on structural sharing.
+    Attaching swaps the character's inventory list for a SharedInventory, after
+    which the usual Character and CharacterBuilder methods keep working. Taking
+    a snapshot and restoring one are O(1), edits in between are O(log n), and
+    each version only costs memory for the nodes its changes touched.
+
+    :param Character character: the character to track.
+    """
+
+    def __init__(self, character: Character):
+        self.character = character
+        self._versions = []
+        self._current = -1
+        self.snapshot()
+
+    def _inventory_root(self):
+        inventory = self.character._inventory
+        if not isinstance(inventory, SharedInventory):
+            # the inventory was replaced wholesale (e.g. by set_inventory)
+            inventory = SharedInventory(inventory)
+            self.character._inventory = inventory
+        return inventory._root
+
+    def snapshot(self) -> int:
+        """
+        Records the character's current stats, health and inventory.
+        Any versions after the current one (undone changes) are discarded.
+
+        :return int: the number of the new version.
+        """
+        root = self._inventory_root()
+        stats = self.character.stats
+        previous = self._versions[self._current] if self._versions else None
+
+        if previous is not None and previous.stats == stats:
+            frozen_stats = previous.stats
+        else:
+            frozen_stats = MappingProxyType(dict(stats))
+
+        del self._versions[self._current + 1 :]
+        self._versions.append(Snapshot(frozen_stats, self.character.health, root))
+        self._current = len(self._versions) - 1
+
+        return self._current
+
+    def restore(self, version: int) -> Character:
+        """
+        Returns the character to a recorded version.
+
+        :param int version: a version number returned by snapshot.
+        :return Character: the tracked character.
+        """
+        if not 0 <= version < len(self._versions):
+            raise IndexError(f"No such version: {version}")
+
+        snap = self._versions[version]
+        self.character.stats = dict(snap.stats)
+        self.character.health = snap.health
+        self.character._inventory = SharedInventory._from_root(snap._root)
+        self._current = version
+
+        return self.character
+
+    def undo(self) -> Character:
+        """
+        Restores the version before the current one.
+
+        :return Character: the tracked character.
+        """
+        if self._current == 0:
+            raise IndexError("Nothing to undo")
+        return self.restore(self._current - 1)
+
+    def redo(self) -> Character:
+        """
+        Restores the version after the current one, if it was undone.
+
+        :return Character: the tracked character.
+        """
+        if self._current == len(self._versions) - 1:
+            raise IndexError("Nothing to redo")
+        return self.restore(self._current + 1)
+
+    @property
+    def current(self) -> int:
+        return self._current
+
+    def __getitem__(self, version: int) -> Snapshot:
+        return self._versions[version]
+
+    def __len__(self):
+        return len(self._versions)
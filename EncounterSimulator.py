@@ -0,0 +1,490 @@
+from __future__ import annotations
+
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+# class name -> (attack stat, damage die, armor bonus on top of 10 + DEX)
+COMBAT_PROFILES = {
+    "Barbarian": ("STR", 12, 0),
+    "Bard": ("CHA", 8, 1),
+    "Cleric": ("WIS", 8, 6),
+    "Druid": ("WIS", 8, 2),
+    "Fighter": ("STR", 10, 6),
+    "Monk": ("DEX", 6, 0),
+    "Paladin": ("STR", 8, 8),
+    "Ranger": ("DEX", 8, 2),
+    "Rogue": ("DEX", 6, 1),
+    "Sorcerer": ("CHA", 10, 0),
+    "Warlock": ("CHA", 10, 1),
+    "Wizard": ("INT", 10, 0),
+}
+PROFICIENCY = 2
+
+
+def modifier(score: int) -> int:
+    """
+    Converts a stat score into its modifier (10-11 -> +0, 12-13 -> +1, ...).
+
+    :param int score: the stat score.
+    :return int: the modifier.
+    """
+    return (score - 10) // 2
+
+
+class Combatant:
+    """
+    The per-fight state of one character: current health, derived combat
+    numbers and how many uses of its special ability are left.
+    """
+
+    __slots__ = (
+        "name",
+        "char_class",
+        "side",
+        "index",
+        "max_hp",
+        "hp",
+        "temp_hp",
+        "attack_bonus",
+        "damage_die",
+        "damage_mod",
+        "armor_class",
+        "initiative_mod",
+        "stats",
+        "uses",
+        "raging",
+        "inspired",
+        "damage_dealt",
+    )
+
+    def __init__(self, snapshot: tuple, side: int, index: int):
+        name, char_class, health, stats = snapshot
+        attack_stat, damage_die, armor = COMBAT_PROFILES[char_class]
+        dex_mod = modifier(stats.get("DEX", 10))
+
+        self.name = name
+        self.char_class = char_class
+        self.side = side
+        self.index = index
+        self.max_hp = health
+        self.hp = health
+        self.temp_hp = 0
+        self.attack_bonus = modifier(stats.get(attack_stat, 10)) + PROFICIENCY
+        self.damage_die = damage_die
+        self.damage_mod = modifier(stats.get(attack_stat, 10))
+        self.armor_class = 10 + dex_mod + armor
+        if char_class == "Barbarian":
+            self.armor_class += modifier(stats.get("CON", 10))
+        elif char_class == "Monk":
+            self.armor_class += modifier(stats.get("WIS", 10))
+        self.initiative_mod = dex_mod
+        self.stats = stats
+        self.uses = 2
+        self.raging = 0
+        self.inspired = 0
+        self.damage_dealt = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.hp > 0
+
+    @property
+    def bloodied(self) -> bool:
+        return self.hp * 2 <= self.max_hp
+
+    def take_damage(self, amount: int) -> int:
+        """
+        Applies damage, letting rage halve it and temporary health absorb it first.
+
+        :return int: the damage actually taken off health and temporary health.
+        """
+        if self.raging:
+            amount //= 2
+        absorbed = min(self.temp_hp, amount)
+        self.temp_hp -= absorbed
+        taken = min(self.hp, amount - absorbed)
+        self.hp -= taken
+
+        return absorbed + taken
+
+    def heal(self, amount: int) -> None:
+        self.hp = min(self.max_hp, self.hp + max(amount, 0))
+
+
+def _roll(rng: random.Random, dice: int, sides: int) -> int:
+    return sum(rng.randint(1, sides) for _ in range(dice))
+
+
+def _deal(actor: Combatant, target: Combatant, amount: int) -> None:
+    actor.damage_dealt += target.take_damage(max(amount, 0))
+
+
+def _attack(actor: Combatant, target: Combatant, rng: random.Random) -> bool:
+    """
+    Makes one weapon or spell attack, applying the actor's on-hit ability.
+
+    :return bool: whether the attack hit.
+    """
+    natural = rng.randint(1, 20)
+    total = natural + actor.attack_bonus + actor.inspired
+    actor.inspired = 0
+    if natural == 1 or (natural != 20 and total < target.armor_class):
+        return False
+
+    dice = 2 if natural == 20 else 1
+    damage = _roll(rng, dice, actor.damage_die) + actor.damage_mod
+    on_hit = ON_HIT.get(actor.char_class)
+    if on_hit:
+        damage += on_hit(actor, rng) * dice
+    _deal(actor, target, damage)
+
+    return True
+
+
+# Special abilities. An ON_TURN handler runs at the start of the actor's turn
+# and returns how many attacks the actor still makes; an ON_HIT handler returns
+# extra damage dice rolled when an attack lands.
+
+
+def _rage(actor, allies, enemies, rng) -> int:
+    # rage lasts a minute (10 rounds) and can be entered twice per encounter
+    if actor.raging:
+        actor.raging -= 1
+    elif actor.uses:
+        actor.uses -= 1
+        actor.raging = 10
+    return 1
+
+
+def _inspiration(actor, allies, enemies, rng) -> int:
+    others = [ally for ally in allies if ally is not actor and ally.alive]
+    if others:
+        rng.choice(others).inspired = rng.randint(1, 6)
+    return 1
+
+
+def _divine_healing(actor, allies, enemies, rng) -> int:
+    wounded = [ally for ally in allies if ally.alive and ally.bloodied]
+    if actor.uses and wounded:
+        actor.uses -= 1
+        min(wounded, key=lambda ally: ally.hp).heal(
+            _roll(rng, 2, 8) + modifier(actor.stats.get("WIS", 10))
+        )
+        return 0
+    return 1
+
+
+def _wild_shape(actor, allies, enemies, rng) -> int:
+    if actor.uses and actor.bloodied:
+        actor.uses = 0
+        actor.temp_hp += 20
+    return 1
+
+
+def _second_wind(actor, allies, enemies, rng) -> int:
+    if actor.uses and actor.bloodied:
+        actor.uses = 0
+        actor.heal(_roll(rng, 1, 10) + 1)
+    return 1
+
+
+def _flurry_of_blows(actor, allies, enemies, rng) -> int:
+    return 2
+
+
+def _spell_casting(actor, allies, enemies, rng) -> int:
+    living = [enemy for enemy in enemies if enemy.alive]
+    if actor.uses and len(living) > 1:
+        actor.uses -= 1
+        for enemy in living:
+            _deal(actor, enemy, _roll(rng, 3, 6))
+        return 0
+    return 1
+
+
+def _eldritch_blast(actor, allies, enemies, rng) -> int:
+    return 2
+
+
+def _arcane_mastery(actor, allies, enemies, rng) -> int:
+    living = [enemy for enemy in enemies if enemy.alive]
+    if actor.uses and living:
+        actor.uses -= 1
+        target = min(living, key=lambda enemy: enemy.hp)
+        _deal(actor, target, sum(rng.randint(1, 4) + 1 for _ in range(3)))
+        return 0
+    return 1
+
+
+def _rage_damage(actor, rng) -> int:
+    return 2 if actor.raging else 0
+
+
+def _divine_smite(actor, rng) -> int:
+    if actor.uses:
+        actor.uses -= 1
+        return _roll(rng, 2, 8)
+    return 0
+
+
+def _hunters_mark(actor, rng) -> int:
+    return rng.randint(1, 6)
+
+
+def _sneak_attack(actor, rng) -> int:
+    return _roll(rng, 2, 6)
+
+
+ON_TURN = {
+    "Barbarian": _rage,
+    "Bard": _inspiration,
+    "Cleric": _divine_healing,
+    "Druid": _wild_shape,
+    "Fighter": _second_wind,
+    "Monk": _flurry_of_blows,
+    "Sorcerer": _spell_casting,
+    "Warlock": _eldritch_blast,
+    "Wizard": _arcane_mastery,
+}
+
+ON_HIT = {
+    "Barbarian": _rage_damage,
+    "Paladin": _divine_smite,
+    "Ranger": _hunters_mark,
+    "Rogue": _sneak_attack,
+}
+
+
+def fight(
+    party_a: list, party_b: list, rng: random.Random, max_rounds: int = 100
+) -> tuple:
+    """
+    Plays a single encounter between two parties of character snapshots.
+    Every round each living combatant, in initiative order, uses its ability
+    and attacks the living enemy with the least health.
+
+    :param list party_a: snapshots of the first party, see snapshot().
+    :param list party_b: snapshots of the second party.
+    :param random.Random rng: the random generator driving the fight.
+    :param int max_rounds: rounds after which the encounter is a draw.
+    :return tuple: (winner 0/1 or None for a draw, rounds, combatants).
+    """
+    sides = (
+        [Combatant(snap, 0, i) for i, snap in enumerate(party_a)],
+        [Combatant(snap, 1, i) for i, snap in enumerate(party_b)],
+    )
+    order = sorted(
+        sides[0] + sides[1],
+        key=lambda combatant: rng.randint(1, 20) + combatant.initiative_mod,
+        reverse=True,
+    )
+
+    for round_number in range(1, max_rounds + 1):
+        for actor in order:
+            if not actor.alive:
+                continue
+            allies, enemies = sides[actor.side], sides[1 - actor.side]
+
+            on_turn = ON_TURN.get(actor.char_class)
+            attacks = on_turn(actor, allies, enemies, rng) if on_turn else 1
+            for _ in range(attacks):
+                living = [enemy for enemy in enemies if enemy.alive]
+                if not living:
+                    break
+                _attack(actor, min(living, key=lambda enemy: enemy.hp), rng)
+
+            if not any(enemy.alive for enemy in enemies):
+                return actor.side, round_number, sides[0] + sides[1]
+
+    return None, max_rounds, sides[0] + sides[1]
+
+
+def snapshot(character) -> tuple:
+    """
+    Reduces a Character to the plain data the simulator needs, so it can be
+    sent to worker processes cheaply.
+
+    :param Character character: the character to snapshot.
+    :return tuple: (name, class, health, stats).
+    """
+    return (
+        character._name,
+        character._character_class,
+        character.health,
+        dict(character.stats),
+    )
+
+
+def simulate_batch(
+    party_a: list, party_b: list, trials: int, seed, max_rounds: int = 100
+) -> dict:
+    """
+    Runs a batch of independent encounters and returns summed results.
+    Module level so it can be sent to a process pool.
+
+    :param list party_a: snapshots of the first party.
+    :param list party_b: snapshots of the second party.
+    :param int trials: the number of encounters to play.
+    :param seed: seed for this batch's random generator.
+    :param int max_rounds: rounds after which an encounter is a draw.
+    :return dict: win counts, round and damage sums, per combatant totals.
+    """
+    rng = random.Random(seed)
+    totals = {
+        "trials": trials,
+        "wins": [0, 0, 0],
+        "rounds": 0,
+        "damage": [0, 0],
+        "combatant_damage": [[0] * len(party_a), [0] * len(party_b)],
+        "combatant_survived": [[0] * len(party_a), [0] * len(party_b)],
+    }
+
+    for _ in range(trials):
+        winner, rounds, combatants = fight(party_a, party_b, rng, max_rounds)
+        totals["wins"][2 if winner is None else winner] += 1
+        totals["rounds"] += rounds
+        for combatant in combatants:
+            totals["damage"][combatant.side] += combatant.damage_dealt
+            totals["combatant_damage"][combatant.side][
+                combatant.index
+            ] += combatant.damage_dealt
+            totals["combatant_survived"][combatant.side][
+                combatant.index
+            ] += combatant.alive
+
+    return totals
+
+
+class EncounterSimulator:
+    """
+    Monte Carlo simulator pitting two rosters of Characters against each other.
+    Trials are split into fixed-size batches, each seeded from the run seed and
+    its batch number, so results only depend on the seed and batch size and not
+    on how many worker processes played them.
+
+    :param list party_a: the first roster of Character objects.
+    :param list party_b: the second roster of Character objects.
+    :param int max_rounds: rounds after which an encounter is a draw.
+    """
+
+    def __init__(self, party_a: list, party_b: list, max_rounds: int = 100):
+        if not party_a or not party_b:
+            raise ValueError("Both parties need at least one character")
+        for char in list(party_a) + list(party_b):
+            if char._character_class not in COMBAT_PROFILES:
+                raise ValueError(
+                    f"Unsupported character class: {char._character_class}"
+                )
+
+        self.party_a = [snapshot(char) for char in party_a]
+        self.party_b = [snapshot(char) for char in party_b]
+        self.max_rounds = max_rounds
+
+    def run(
+        self, trials: int, seed: int = None, workers: int = None, batch_size: int = 250
+    ) -> dict:
+        """
+        Plays trials encounters, in batches across a process pool.
+
+        :param int trials: the number of encounters to play.
+        :param int seed: seed for reproducible results, picked at random if omitted.
+        :param int workers: worker processes, defaults to the CPU count.
+        :param int batch_size: encounters per batch.
+        :return dict: win rates, mean rounds and damage statistics.
+        """
+        if trials < 1:
+            raise ValueError("trials must be at least 1")
+        if seed is None:
+            seed = random.randrange(2**32)
+        workers = workers or os.cpu_count() or 1
+
+        batches = [
+            (
+                self.party_a,
+                self.party_b,
+                min(batch_size, trials - start),
+                f"{seed}:{number}",
+                self.max_rounds,
+            )
+            for number, start in enumerate(range(0, trials, batch_size))
+        ]
+
+        if workers == 1 or len(batches) == 1:
+            results = [simulate_batch(*batch) for batch in batches]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(batches))) as pool:
+                results = list(pool.map(simulate_batch, *zip(*batches)))
+
+        return self._summarise(results, seed)
+
+    def _summarise(self, results: list, seed: int) -> dict:
+        trials = sum(result["trials"] for result in results)
+        wins = [sum(result["wins"][i] for result in results) for i in range(3)]
+        damage = [sum(result["damage"][i] for result in results) for i in range(2)]
+
+        combatants = []
+        for side, party in enumerate((self.party_a, self.party_b)):
+            for index, (name, char_class, _, _) in enumerate(party):
+                dealt = sum(r["combatant_damage"][side][index] for r in results)
+                survived = sum(r["combatant_survived"][side][index] for r in results)
+                combatants.append(
+                    {
+                        "name": name,
+                        "class": char_class,
+                        "side": "A" if side == 0 else "B",
+                        "mean_damage": dealt / trials,
+                        "survival_rate": survived / trials,
+                    }
+                )
+
+        return {
+            "seed": seed,
+            "trials": trials,
+            "wins": {"A": wins[0], "B": wins[1], "draw": wins[2]},
+            "win_rate": {"A": wins[0] / trials, "B": wins[1] / trials},
+            "win_rate_ci": _wilson_interval(wins[0], trials),
+            "mean_rounds": sum(result["rounds"] for result in results) / trials,
+            "mean_damage": {"A": damage[0] / trials, "B": damage[1] / trials},
+            "combatants": combatants,
+        }
+
+
+def _wilson_interval(successes: int, trials: int, z: float = 1.96) -> tuple:
+    """
+    95% Wilson score interval for a win rate.
+    """
+    rate = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (rate + z * z / (2 * trials)) / denominator
+    spread = z * math.sqrt(rate * (1 - rate) / trials + z * z / (4 * trials * trials))
+
+    return centre - spread / denominator, centre + spread / denominator
+
+
+def format_results(results: dict) -> str:
+    """
+    Renders simulation results as human readable text.
+
+    :param dict results: results returned by EncounterSimulator.run.
+    :return str: the formatted results.
+    """
+    low, high = results["win_rate_ci"]
+    lines = [
+        f"{results['trials']} encounters (seed {results['seed']})",
+        f"Party A wins: {results['win_rate']['A']:.1%} (95% CI {low:.1%} - {high:.1%})",
+        f"Party B wins: {results['win_rate']['B']:.1%}",
+        f"Draws: {results['wins']['draw']}",
+        f"Mean rounds: {results['mean_rounds']:.1f}",
+        f"Mean damage dealt: A {results['mean_damage']['A']:.1f}, "
+        f"B {results['mean_damage']['B']:.1f}",
+        "",
+    ]
+    lines += [
+        f"  [{c['side']}] {c['class']} {c['name']}: {c['mean_damage']:.1f} damage, "
+        f"survives {c['survival_rate']:.1%}"
+        for c in results["combatants"]
+    ]
+
+    return "\n".join(lines)
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+
+from Character import Character, CharacterManager
+from CharacterHistory import SharedInventory
+from Item import Item
+
+
+class MemoryProfiler:
+    """
+    Measures where memory goes when a roster is loaded.
+    Loads a JSON roster under tracemalloc and walks the resulting characters,
+    attributing every reachable object to a category (Character, stats, Item,
+    inventory, str, other). Objects shared between characters are only counted
+    once, so the totals match what the roster actually keeps alive.
+    """
+
+    CATEGORIES = ("Character", "stats", "inventory", "Item", "str", "other")
+
+    def __init__(self, top_allocations: int = 5):
+        """
+        :param int top_allocations: how many allocation sites to report from the load path.
+        """
+        self.top_allocations = top_allocations
+
+    def profile_file(self, json_file) -> dict:
+        """
+        Loads json_file and reports the memory footprint of the roster.
+
+        :param str json_file: the file path of the JSON file containing Character data.
+        :return dict: the memory report, see profile_characters for the layout.
+        """
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+
+            characters = CharacterManager.load_characters(json_file)
+
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+        report = self.profile_characters(characters)
+        report["load"] = {
+            "file": json_file,
+            "retained": current - before,
+            "peak": peak - before,
+            "top_allocations": [
+                {
+                    "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    "bytes": stat.size,
+                    "count": stat.count,
+                }
+                for stat in snapshot.statistics("lineno")[: self.top_allocations]
+            ],
+        }
+        report["construction"] = self.profile_construction()
+
+        return report
+
+    def profile_characters(self, characters: list) -> dict:
+        """
+        Reports the deep memory footprint of already loaded characters.
+
+        :param list characters: the Character objects to measure.
+        :return dict: totals by category and class, per character sizes and duplicates.
+        """
+        seen = set()
+        by_category = Counter({category: 0 for category in self.CATEGORIES})
+        by_class = Counter()
+        per_character = []
+        strings = defaultdict(set)
+        items = defaultdict(list)
+
+        for char in characters:
+            char_total = self._walk(
+                char, "Character", seen, by_category, strings, items
+            )
+            by_class[char._character_class] += char_total
+            per_character.append(
+                {
+                    "name": char._name,
+                    "class": char._character_class,
+                    "bytes": char_total,
+                }
+            )
+
+        return {
+            "characters": len(characters),
+            "total": sum(by_category.values()),
+            "by_category": dict(by_category),
+            "by_class": dict(by_class),
+            "per_character": per_character,
+            "duplicate_strings": self._duplicate_strings(strings),
+            "duplicate_items": self._duplicate_items(items),
+        }
+
+    def profile_construction(self) -> dict:
+        """
+        Measures the peak and retained memory of building one character of each class.
+        Character.__init__ builds the default items of every class before keeping one,
+        so the gap between peak and retained is the per-character waste.
+
+        :return dict: peak and retained bytes per character class.
+        """
+        from CharacterBuilder import CharacterBuilder
+
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+
+        results = {}
+        try:
+            for char_class in sorted(
+                cls.__name__ for cls in Character.__subclasses__()
+            ):
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                char = (
+                    CharacterBuilder().set_name("probe").set_class(char_class).build()
+                )
+                current, peak = tracemalloc.get_traced_memory()
+                results[char_class] = {
+                    "peak": peak - before,
+                    "retained": current - before,
+                }
+                del char
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+        return results
+
+    def _walk(self, obj, category, seen, by_category, strings, items) -> int:
+        """
+        Adds obj and everything it references to the report, returning the bytes counted.
+        """
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+
+        size = sys.getsizeof(obj)
+        if isinstance(obj, str):
+            by_category["str"] += size
+            strings[obj].add(id(obj))
+            return size
+        # Sequence also covers list-like inventories such as SharedInventory
+        if not isinstance(obj, (dict, Sequence, Character, Item)):
+            # leaves such as stat values count towards whatever holds them
+            by_category[category] += size
+            return size
+
+        by_category[category] += size
+        total = size
+
+        if isinstance(obj, Character):
+            attrs = vars(obj)
+            total += self._account(attrs, "Character", seen, by_category)
+            for key, value in attrs.items():
+                total += self._walk(key, "Character", seen, by_category, strings, items)
+                child = {"stats": "stats", "_inventory": "inventory"}.get(
+                    key, "Character"
+                )
+                total += self._walk(value, child, seen, by_category, strings, items)
+        elif isinstance(obj, Item):
+            attrs = vars(obj)
+            items[(obj.name, obj.description, obj.value)].append(size)
+            total += self._account(attrs, "Item", seen, by_category)
+            for key, value in attrs.items():
+                total += self._walk(key, "Item", seen, by_category, strings, items)
+                total += self._walk(value, "Item", seen, by_category, strings, items)
+        elif isinstance(obj, dict):
+            for key, value in obj.items():
+                total += self._walk(key, category, seen, by_category, strings, items)
+                total += self._walk(value, category, seen, by_category, strings, items)
+        else:
+            if isinstance(obj, SharedInventory):
+                # the tree nodes play the part of a list's slots; nodes shared
+                # with other inventories are only counted the first time
+                for node in obj.nodes():
+                    total += self._account(node, category, seen, by_category)
+            for value in obj:
+                child = "Item" if isinstance(value, Item) else category
+                total += self._walk(value, child, seen, by_category, strings, items)
+
+        return total
+
+    @staticmethod
+    def _account(obj, category, seen, by_category) -> int:
+        """
+        Counts a container's own size without following its contents.
+        """
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        size = sys.getsizeof(obj)
+        by_category[category] += size
+
+        return size
+
+    @staticmethod
+    def _duplicate_strings(strings: dict) -> dict:
+        """
+        Finds equal strings held as separate objects, which sys.intern could share.
+        """
+        duplicates = {value: len(ids) for value, ids in strings.items() if len(ids) > 1}
+        wasted = sum(
+            sys.getsizeof(value) * (count - 1) for value, count in duplicates.items()
+        )
+
+        return {
+            "distinct": len(duplicates),
+            "copies": sum(duplicates.values()),
+            "wasted_bytes": wasted,
+            "top": sorted(duplicates.items(), key=lambda pair: -pair[1])[:10],
+        }
+
+    @staticmethod
+    def _duplicate_items(items: dict) -> dict:
+        """
+        Finds Item objects with identical name, description and value.
+        """
+        duplicates = {key: sizes for key, sizes in items.items() if len(sizes) > 1}
+
+        return {
+            "distinct": len(duplicates),
+            "copies": sum(len(sizes) for sizes in duplicates.values()),
+            "wasted_bytes": sum(sum(sizes[1:]) for sizes in duplicates.values()),
+            "top": sorted(
+                ((key[0], len(sizes)) for key, sizes in duplicates.items()),
+                key=lambda pair: -pair[1],
+            )[:10],
+        }
+
+
+def format_report(report: dict) -> str:
+    """
+    Renders a memory report as human readable text.
+
+    :param dict report: a report returned by MemoryProfiler.
+    :return str: the formatted report.
+    """
+    lines = [
+        f"Characters: {report['characters']}",
+        f"Deep size: {report['total']} bytes",
+        "",
+        "By category:",
+    ]
+    lines += [
+        f"  {name:<10} {size:>10}" for name, size in report["by_category"].items()
+    ]
+    lines += ["", "By class:"]
+    lines += [
+        f"  {name:<10} {size:>10}"
+        for name, size in sorted(report["by_class"].items(), key=lambda pair: -pair[1])
+    ]
+
+    strings = report["duplicate_strings"]
+    items = report["duplicate_items"]
+    lines += [
+        "",
+        f"Duplicated strings: {strings['distinct']} values in {strings['copies']} "
+        f"copies, {strings['wasted_bytes']} bytes could be shared",
+        f"Duplicated items: {items['distinct']} items in {items['copies']} "
+        f"copies, {items['wasted_bytes']} bytes could be shared",
+    ]
+
+    if "load" in report:
+        load = report["load"]
+        lines += [
+            "",
+            f"Load of {load['file']}: peak {load['peak']} bytes, "
+            f"retained {load['retained']} bytes",
+        ]
+        lines += [
+            f"  {site['location']}: {site['bytes']} bytes in {site['count']} blocks"
+            for site in load["top_allocations"]
+        ]
+
+    if "construction" in report:
+        lines += ["", "Building one character (peak / retained bytes):"]
+        lines += [
+            f"  {name:<10} {sizes['peak']:>8} / {sizes['retained']:>8}"
+            for name, sizes in report["construction"].items()
+        ]
+
+    return "\n".join(lines)
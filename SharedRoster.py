@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+
+from Character import Character, CharacterManager
+from CharacterBuilder import CharacterBuilder
+
+
+class ReadWriteLock:
+    """
+    A readers-writer lock: any number of readers, or a single writer.
+    Waiting writers block new readers, so a steady stream of reads cannot
+    starve updates. The lock is not reentrant.
+
+    Use ``with lock.reader:`` or ``with lock.writer:``.
+    """
+
+    def __init__(self):
+        self._mutex = threading.Lock()
+        self._cond = threading.Condition(self._mutex)
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+        self.reader = _Guard(self.acquire_read, self.release_read)
+        self.writer = _Guard(self.acquire_write, self.release_write)
+
+    def acquire_read(self) -> None:
+        with self._mutex:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        with self._mutex:
+            self._readers -= 1
+            if not self._readers and self._waiting_writers:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        with self._mutex:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        with self._mutex:
+            self._writer = False
+            self._cond.notify_all()
+
+
+class _Guard:
+    """
+    Context manager for one side of a ReadWriteLock.
+    """
+
+    __slots__ = ("_acquire", "_release")
+
+    def __init__(self, acquire, release):
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self):
+        self._acquire()
+
+    def __exit__(self, *exc_info):
+        self._release()
+
+
+class SharedRoster:
+    """
+    A roster of characters that can be shared between threads.
+    A lock serialises adding and removing characters, and each character has
+    its own readers-writer lock guarding its stats, health and inventory.
+    Looking a character up takes no lock, since the roster only ever replaces
+    whole entries, so threads only contend when they touch the same character.
+
+    Every write also publishes a plain-data copy of the character, which get()
+    copies without taking any lock. Readers that only need the data therefore
+    never hold up writers, however many of them there are.
+
+    Characters must only be used inside reading() or writing() once added.
+    """
+
+    def __init__(self, characters: list = None):
+        self._lock = threading.Lock()
+        self._entries = {}  # name -> _Entry
+        for char in characters or []:
+            self.add(char)
+
+    def add(self, character: Character) -> None:
+        """
+        Adds a character to the roster.
+
+        :param Character character: the character to add, keyed by its name.
+        """
+        with self._lock:
+            if character._name in self._entries:
+                raise ValueError(f"Character already in roster: {character._name}")
+            self._entries[character._name] = _Entry(character)
+
+    def build(
+        self, name: str, char_class: str, stats: dict = None, items: list = None
+    ) -> dict:
+        """
+        Builds a character and adds it to the roster.
+        CharacterBuilder keeps the character it is building as state, so a
+        builder must never be shared between threads; this uses a fresh one
+        per call.
+
+        :param str name: The name of the character.
+        :param str char_class: The class of the character (e.g., Barbarian).
+        :param dict stats: optional stats to override the class defaults.
+        :param list items: optional items replacing the default inventory.
+        :return dict: a copy of the character's data, as returned by get().
+        """
+        builder = CharacterBuilder().set_name(name).set_class(char_class)
+        if stats:
+            builder.set_stats(stats)
+        if items is not None:
+            builder.set_inventory(list(items))
+        self.add(builder.build())
+
+        return self.get(name)
+
+    def remove(self, name: str) -> Character:
+        """
+        Removes a character from the roster, waiting for anyone using it.
+
+        :param str name: the name of the character.
+        :return Character: the removed character.
+        """
+        with self._lock:
+            entry = self._entries.pop(name)
+        with entry.lock.writer:
+            return entry.character
+
+    def _entry(self, name: str) -> _Entry:
+        try:
+            return self._entries[name]
+        except KeyError:
+            raise KeyError(f"No character named {name} in roster") from None
+
+    def _check_current(self, name: str, entry: _Entry) -> None:
+        """
+        Makes sure the entry wasn't removed while waiting for its write lock.
+        """
+        if self._entries.get(name) is not entry:
+            raise KeyError(f"No character named {name} in roster")
+
+    @contextmanager
+    def reading(self, name: str):
+        """
+        Gives shared read access to a character.
+
+        :param str name: the name of the character.
+        """
+        entry = self._entry(name)
+        with entry.lock.reader:
+            yield entry.character
+
+    @contextmanager
+    def writing(self, name: str):
+        """
+        Gives exclusive access to a character for changing it.
+
+        :param str name: the name of the character.
+        """
+        entry = self._entry(name)
+        with entry.lock.writer:
+            self._check_current(name, entry)
+            try:
+                yield entry.character
+            finally:
+                entry.publish()
+
+    def get(self, name: str) -> dict:
+        """
+        Reads a consistent copy of a character as of its latest write.
+
+        :param str name: the name of the character.
+        :return dict: the character as returned by Character.to_dict.
+        """
+        return _copy_data(self._entry(name).data)
+
+    def update(self, name: str, change) -> None:
+        """
+        Applies a change to a character while holding its write lock.
+
+        :param str name: the name of the character.
+        :param change: a callable taking the Character to change.
+        """
+        entry = self._entry(name)
+        with entry.lock.writer:
+            self._check_current(name, entry)
+            try:
+                change(entry.character)
+            finally:
+                entry.publish()
+
+    def names(self) -> list:
+        with self._lock:
+            return list(self._entries)
+
+    def save(self, output_file) -> None:
+        """
+        Saves a consistent copy of every character in the roster to a JSON file.
+
+        :param str output_file: the file path where the character data should be stored.
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+
+        copies = []
+        for entry in entries:
+            with entry.lock.reader:
+                copies.append(entry.character.copy())
+
+        CharacterManager.save_characters(copies, output_file)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class _Entry:
+    """
+    A character in the roster, its lock and its last published data.
+    """
+
+    __slots__ = ("character", "lock", "data")
+
+    def __init__(self, character: Character):
+        self.character = character
+        self.lock = ReadWriteLock()
+        self.publish()
+
+    def publish(self) -> None:
+        # the published dict is never changed after this, only replaced
+        self.data = _copy_data(self.character.to_dict())
+
+
+def _copy_data(data: dict) -> dict:
+    """
+    Copies the mutable parts of a Character.to_dict result.
+    """
+    copied = dict(data)
+    copied["stats"] = dict(data["stats"])
+    copied["inventory"] = [dict(item) for item in data["inventory"]]
+
+    return copied
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import random
+from array import array
+from itertools import permutations, product
+
+from CharacterBuilder import CHAR_CLASS_MAP
+
+STATS = ("STR", "DEX", "CON", "INT", "WIS", "CHA")
+
+POINT_BUY_COSTS = {8: 0, 9: 1, 10: 2, 11: 3, 12: 4, 13: 5, 14: 7, 15: 9}
+POINT_BUY_BUDGET = 27
+STANDARD_ARRAY = (15, 14, 13, 12, 10, 8)
+
+
+def _four_d6_table() -> tuple:
+    """
+    Every one of the 6**4 equally likely 4d6 rolls, each reduced to the sum of
+    its three highest dice. Picking uniformly from it is an exact 4d6-drop-lowest.
+    """
+    return tuple(sum(dice) - min(dice) for dice in product(range(1, 7), repeat=4))
+
+
+def _point_buy_table() -> tuple:
+    """
+    Every stat line that spends exactly the point-buy budget.
+    """
+    return tuple(
+        scores
+        for scores in product(POINT_BUY_COSTS, repeat=len(STATS))
+        if sum(POINT_BUY_COSTS[score] for score in scores) == POINT_BUY_BUDGET
+    )
+
+
+def _standard_array_table() -> tuple:
+    """
+    Every assignment of the standard array to the six stats.
+    """
+    return tuple(permutations(STANDARD_ARRAY))
+
+
+class StatRoller:
+    """
+    Generates character stats in batches.
+    Every method draws from a precomputed table of equally likely outcomes, so a
+    whole batch is a single random.choices call written straight into an
+    array-backed buffer of unsigned bytes. Stats for character i live at
+    buffer[i * 6:(i + 1) * 6], in STATS order.
+
+    :param int seed: seed for the roller's private random generator.
+    """
+
+    METHODS = ("4d6", "point-buy", "standard")
+
+    _tables = {}
+
+    def __init__(self, seed: int = None):
+        self._random = random.Random(seed)
+
+    @classmethod
+    def _table(cls, method: str) -> tuple:
+        if method not in cls._tables:
+            if method == "4d6":
+                cls._tables[method] = _four_d6_table()
+            elif method == "point-buy":
+                cls._tables[method] = _point_buy_table()
+            elif method == "standard":
+                cls._tables[method] = _standard_array_table()
+            else:
+                raise ValueError(f"Unsupported stat method: {method}")
+
+        return cls._tables[method]
+
+    def roll(self, count: int, method: str = "4d6") -> array:
+        """
+        Rolls stats for a batch of characters.
+
+        :param int count: the number of characters to roll for.
+        :param str method: one of "4d6", "point-buy" or "standard".
+        :return array: a flat buffer of count * 6 stat values.
+        """
+        if count < 0:
+            raise ValueError("count must not be negative")
+
+        table = self._table(method)
+        if method == "4d6":
+            # each stat is an independent draw
+            return array("B", self._random.choices(table, k=count * len(STATS)))
+
+        # point-buy and standard array draw a whole stat line at once
+        buffer = array("B")
+        for line in self._random.choices(table, k=count):
+            buffer.extend(line)
+
+        return buffer
+
+    def roll_one(self, method: str = "4d6") -> dict:
+        """
+        Rolls stats for a single character.
+
+        :param str method: one of "4d6", "point-buy" or "standard".
+        :return dict: stat name to value, ready for CharacterBuilder.set_stats.
+        """
+        return dict(zip(STATS, self.roll(1, method)))
+
+    def build_characters(
+        self, char_class: str, count: int, method: str = "4d6", name_prefix: str = None
+    ) -> list:
+        """
+        Rolls a batch of stats and builds a character from each stat line.
+
+        :param str char_class: The class of the characters (e.g., Barbarian).
+        :param int count: the number of characters to build.
+        :param str method: one of "4d6", "point-buy" or "standard".
+        :param str name_prefix: names are name_prefix followed by the index, defaults to the class.
+        :return list: the built Character objects.
+        """
+        if char_class not in CHAR_CLASS_MAP:
+            raise ValueError(f"Unsupported character class: {char_class}")
+
+        return build_from_buffer(
+            char_class, self.roll(count, method), name_prefix or char_class
+        )
+
+
+def build_from_buffer(char_class: str, buffer: array, name_prefix: str) -> list:
+    """
+    Builds one character per stat line in a buffer returned by StatRoller.roll.
+
+    :param str char_class: The class of the characters (e.g., Barbarian).
+    :param array buffer: a flat buffer of stat values, six per character.
+    :param str name_prefix: names are name_prefix followed by the index.
+    :return list: the built Character objects.
+    """
+    cls = CHAR_CLASS_MAP[char_class]
+    width = len(STATS)
+
+    return [
+        cls(
+            f"{name_prefix}{i + 1}",
+            stats=dict(zip(STATS, buffer[start : start + width])),
+        )
+        for i, start in enumerate(range(0, len(buffer), width))
+    ]
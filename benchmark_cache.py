@@ -0,0 +1,50 @@
+"""
+Cost of a CharacterCache hit and miss against a plain load_characters call.
+
+    python benchmark_cache.py [characters]
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+from Character import CharacterManager
+from CharacterCache import CharacterCache
+from StatRoller import StatRoller
+
+
+def report(label: str, func) -> float:
+    seconds = min(timeit.repeat(func, number=1, repeat=5))
+    print(f"{label:<24} {seconds * 1000:>10.2f} ms")
+
+    return seconds
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_name = os.path.join(tmp_dir, "roster.json")
+        CharacterManager.save_characters(
+            StatRoller(seed=0).build_characters("Ranger", count), file_name
+        )
+        print(f"Loading {count:,} characters\n")
+
+        plain = report(
+            "load_characters", lambda: CharacterManager.load_characters(file_name)
+        )
+        report(
+            "cache miss",
+            lambda: CharacterManager.load_characters(file_name, cache=CharacterCache()),
+        )
+        cache = CharacterCache()
+        CharacterManager.load_characters(file_name, cache=cache)
+        hit = report(
+            "cache hit",
+            lambda: CharacterManager.load_characters(file_name, cache=cache),
+        )
+        print(f"{'hit speed-up':<24} {plain / hit:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Throughput of EncounterSimulator as the number of worker processes grows.
+
+    python benchmark_encounters.py [trials]
+"""
+
+import os
+import sys
+import time
+
+from EncounterSimulator import EncounterSimulator
+from StatRoller import StatRoller
+
+
+def main():
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    roller = StatRoller(seed=0)
+    party_a = roller.build_characters("Fighter", 2) + roller.build_characters(
+        "Cleric", 2
+    )
+    party_b = roller.build_characters("Barbarian", 2) + roller.build_characters(
+        "Rogue", 2
+    )
+    simulator = EncounterSimulator(party_a, party_b)
+
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, *(n for n in (2, 4, 8, 16, 32) if n <= cores), cores})
+    print(f"Simulating {trials:,} encounters on {cores} CPU(s)\n")
+
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        simulator.run(trials, seed=0, workers=workers)
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        print(
+            f"{workers:>3} worker(s) {trials / seconds:>12,.0f} encounters/s"
+            f"   speed-up {baseline / seconds:>5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
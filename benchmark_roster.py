@@ -0,0 +1,112 @@
+"""
+Read throughput of SharedRoster as reader threads are added while a writer
+keeps changing characters, compared with guarding the roster by one lock.
+The writer's throughput is reported too, to show it is not starved.
+
+    python benchmark_roster.py [seconds per run]
+
+On a standard CPython build the GIL serialises the Python code itself, so
+the numbers show how little the locks get in each other's way rather than
+true parallel speed-up; a free-threaded build lets reads run in parallel.
+"""
+
+import sys
+import threading
+import time
+
+from Item import Item
+from SharedRoster import SharedRoster
+from StatRoller import StatRoller
+
+CHARACTERS = 64
+READER_COUNTS = (1, 2, 4, 8)
+
+
+class GlobalLockRoster:
+    """
+    The naive alternative: every read and write takes the same lock.
+    """
+
+    def __init__(self, characters):
+        self._lock = threading.Lock()
+        self._characters = {char._name: char for char in characters}
+
+    def names(self):
+        return list(self._characters)
+
+    def get(self, name):
+        with self._lock:
+            data = self._characters[name].to_dict()
+            data["stats"] = dict(data["stats"])
+            data["inventory"] = [dict(item) for item in data["inventory"]]
+
+            return data
+
+    def update(self, name, change):
+        with self._lock:
+            change(self._characters[name])
+
+
+def _change(character):
+    character.stats["STR"] = character.stats["STR"] % 18 + 1
+    character.add_item_to_inventory(Item("Arrow", "A single arrow", 1))
+    character.remove_item_from_inventory(character._inventory[-1])
+
+
+def measure(roster, readers: int, seconds: float) -> tuple:
+    """
+    :return tuple: (reads per second, writes per second).
+    """
+    names = roster.names()
+    stop = threading.Event()
+    counts = [0] * readers
+    writes = [0]
+
+    def read(slot):
+        i = slot
+        while not stop.is_set():
+            roster.get(names[i % len(names)])
+            i += readers
+            counts[slot] += 1
+
+    def write():
+        i = 0
+        while not stop.is_set():
+            roster.update(names[i % len(names)], _change)
+            i += 7
+            writes[0] += 1
+
+    threads = [threading.Thread(target=read, args=(slot,)) for slot in range(readers)]
+    threads.append(threading.Thread(target=write))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return sum(counts) / seconds, writes[0] / seconds
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    characters = StatRoller(seed=0).build_characters("Ranger", CHARACTERS)
+    shared = SharedRoster(characters)
+    naive = GlobalLockRoster(StatRoller(seed=0).build_characters("Ranger", CHARACTERS))
+
+    print(f"Reads/s and writes/s with one writer running, {CHARACTERS} characters\n")
+    print(f"{'':>7} {'SharedRoster':^29} {'global lock':^29}")
+    print(
+        f"{'readers':>7} {'reads/s':>14} {'writes/s':>14} {'reads/s':>14} {'writes/s':>14}"
+    )
+    for readers in READER_COUNTS:
+        shared_reads, shared_writes = measure(shared, readers, seconds)
+        naive_reads, naive_writes = measure(naive, readers, seconds)
+        print(
+            f"{readers:>7} {shared_reads:>14,.0f} {shared_writes:>14,.0f}"
+            f" {naive_reads:>14,.0f} {naive_writes:>14,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
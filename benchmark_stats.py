@@ -0,0 +1,102 @@
+"""
+Throughput of StatRoller against a naive per-character random loop.
+Both sides produce the same output: a flat array('B') of stats for the
+rolling comparison, and built characters for the end-to-end comparison.
+
+    python benchmark_stats.py [count]
+"""
+
+import random
+import sys
+import timeit
+from array import array
+
+from CharacterBuilder import CHAR_CLASS_MAP
+from StatRoller import STATS, STANDARD_ARRAY, StatRoller
+
+
+def naive_4d6_line(rng: random.Random) -> list:
+    line = []
+    for _ in STATS:
+        dice = sorted(rng.randint(1, 6) for _ in range(4))
+        line.append(sum(dice[1:]))
+
+    return line
+
+
+def naive_standard_line(rng: random.Random) -> list:
+    line = list(STANDARD_ARRAY)
+    rng.shuffle(line)
+
+    return line
+
+
+def naive_roll(count: int, roll_line, seed: int = 0) -> array:
+    rng = random.Random(seed)
+    buffer = array("B")
+    for _ in range(count):
+        buffer.extend(roll_line(rng))
+
+    return buffer
+
+
+def naive_build(char_class: str, count: int, roll_line, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    cls = CHAR_CLASS_MAP[char_class]
+
+    return [
+        cls(f"{char_class}{i + 1}", stats=dict(zip(STATS, roll_line(rng))))
+        for i in range(count)
+    ]
+
+
+def report(label: str, count: int, func) -> float:
+    seconds = min(timeit.repeat(func, number=1, repeat=3))
+    print(f"{label:<36} {count / seconds:>14,.0f} characters/s")
+
+    return seconds
+
+
+def compare(label: str, count: int, naive, batch) -> None:
+    naive_seconds = report(f"naive {label}", count, naive)
+    batch_seconds = report(f"batched {label}", count, batch)
+    print(f"{'speed-up':<36} {naive_seconds / batch_seconds:>14.1f}x\n")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    built = count // 10
+    roller = StatRoller(seed=0)
+    print(f"Rolling stats for {count:,} characters, building {built:,}\n")
+
+    compare(
+        "4d6 roll",
+        count,
+        lambda: naive_roll(count, naive_4d6_line),
+        lambda: roller.roll(count, "4d6"),
+    )
+    compare(
+        "standard array roll",
+        count,
+        lambda: naive_roll(count, naive_standard_line),
+        lambda: roller.roll(count, "standard"),
+    )
+    report("batched point-buy roll", count, lambda: roller.roll(count, "point-buy"))
+    print()
+
+    compare(
+        "4d6 roll + build",
+        built,
+        lambda: naive_build("Fighter", built, naive_4d6_line),
+        lambda: roller.build_characters("Fighter", built, "4d6"),
+    )
+    compare(
+        "standard array roll + build",
+        built,
+        lambda: naive_build("Fighter", built, naive_standard_line),
+        lambda: roller.build_characters("Fighter", built, "standard"),
+    )
+
+
+if __name__ == "__main__":
+    main()
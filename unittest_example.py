@@ -1,10 +1,24 @@
+import contextlib
+import io
+import os
 import random
 import string
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
 import unittest
 
 from Character import CharacterManager
+from CharacterCache import CharacterCache
+from CharacterHistory import CharacterHistory, SharedInventory
+from EncounterSimulator import Combatant, EncounterSimulator, modifier
 from CharacterBuilder import CharacterBuilder
 from Item import Item
+from MemoryProfiler import MemoryProfiler
+from SharedRoster import ReadWriteLock, SharedRoster
+from StatRoller import POINT_BUY_BUDGET, POINT_BUY_COSTS, STANDARD_ARRAY, StatRoller
 
 
 class MyTestCase(unittest.TestCase):
@@ -78,5 +92,475 @@ class MyTestCase(unittest.TestCase):
         )
 
 
+class CharacterCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.tmp_dir.name, "roster.json")
+        hero = CharacterBuilder().set_name("m1000").set_class("Wizard").build()
+        CharacterManager.save_characters([hero], self.file_name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_cache_hits_return_independent_copies(self):
+        """
+        Ensure a cached load doesn't hand out the cached characters themselves.
+        """
+        cache = CharacterCache()
+        first = CharacterManager.load_characters(self.file_name, cache=cache)
+        first[0].stats["STR"] = 1
+        first[0].add_item_to_inventory(Item("rock", "a rock", 1))
+
+        second = CharacterManager.load_characters(self.file_name, cache=cache)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+        self.assertEqual(second[0].stats["STR"], 8)
+        self.assertEqual(len(second[0]._inventory), 1)
+
+    def test_cache_hit_skips_reading_the_file(self):
+        """
+        Ensure a hit is served without calling the loader again.
+        """
+        cache = CharacterCache()
+        reads = []
+
+        def loader(json_file):
+            reads.append(json_file)
+            return CharacterManager._read_characters(json_file)
+
+        cache.get_or_load(self.file_name, loader)
+        hit = cache.get_or_load(self.file_name, loader)
+
+        self.assertEqual(len(reads), 1)
+        self.assertEqual(hit[0].to_dict(), loader(self.file_name)[0].to_dict())
+
+    def test_cache_reloads_changed_file(self):
+        """
+        Ensure a rewritten file is read again instead of served from the cache.
+        """
+        cache = CharacterCache()
+        CharacterManager.load_characters(self.file_name, cache=cache)
+
+        bard = CharacterBuilder().set_name("abcdefg").set_class("Bard").build()
+        CharacterManager.save_characters([bard, bard], self.file_name)
+        os.utime(self.file_name, ns=(0, 0))
+
+        loaded = CharacterManager.load_characters(self.file_name, cache=cache)
+        self.assertEqual(len(loaded), 2)
+        self.assertEqual(cache.stats()["misses"], 2)
+        self.assertEqual(len(cache), 1)
+
+    def test_cache_does_not_store_failed_loads(self):
+        """
+        Ensure a corrupt file is reported on every load, not cached as empty.
+        """
+        with open(self.file_name, "w") as file:
+            file.write("{not json")
+        cache = CharacterCache()
+
+        for _ in range(2):
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                loaded = CharacterManager.load_characters(self.file_name, cache=cache)
+            self.assertEqual(loaded, [])
+            self.assertIn("Invalid JSON format", output.getvalue())
+
+        self.assertEqual(cache.stats()["hits"], 0)
+        self.assertEqual(len(cache), 0)
+
+    def test_cache_drops_old_version_of_oversized_file(self):
+        """
+        Ensure a file that grows past the budget doesn't leave its old entry behind.
+        """
+        cache = CharacterCache(max_bytes=20_000)
+        CharacterManager.load_characters(self.file_name, cache=cache)
+        self.assertEqual(len(cache), 1)
+
+        CharacterManager.save_characters(
+            StatRoller(seed=1).build_characters("Bard", 200), self.file_name
+        )
+        os.utime(self.file_name, ns=(0, 0))
+        CharacterManager.load_characters(self.file_name, cache=cache)
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()["bytes"], 0)
+
+    def test_cache_evicts_least_recently_used(self):
+        """
+        Ensure the entry limit evicts the least recently used file.
+        """
+        other_file = os.path.join(self.tmp_dir.name, "other.json")
+        CharacterManager.save_characters(
+            CharacterManager.load_characters(self.file_name), other_file
+        )
+        cache = CharacterCache(max_entries=1)
+        CharacterManager.load_characters(self.file_name, cache=cache)
+        CharacterManager.load_characters(other_file, cache=cache)
+        CharacterManager.load_characters(self.file_name, cache=cache)
+
+        self.assertEqual(cache.stats()["evictions"], 2)
+        self.assertEqual(cache.stats()["hits"], 0)
+
+
+class MemoryProfilerTestCase(unittest.TestCase):
+
+    def test_profile_finds_duplicated_items(self):
+        """
+        Ensure equal items held by different characters are reported as shareable.
+        """
+        characters = [
+            CharacterBuilder()
+            .set_name(f"rogue{i}")
+            .set_class("Rogue")
+            .set_inventory([Item("Dagger", "".join(["sh", "arp"]), 130)])
+            .build()
+            for i in range(3)
+        ]
+        report = MemoryProfiler().profile_characters(characters)
+
+        self.assertEqual(report["characters"], 3)
+        self.assertEqual(report["by_class"]["Rogue"], report["total"])
+        self.assertEqual(report["duplicate_items"]["copies"], 3)
+        self.assertEqual(report["duplicate_strings"]["top"][0], ("sharp", 3))
+
+    def test_stat_values_count_as_stats(self):
+        """
+        Ensure the stat values are attributed to the stats category.
+        """
+        hero = (
+            CharacterBuilder()
+            .set_name("m1000")
+            .set_class("Wizard")
+            .set_stats({"STR": 1000, "DEX": 1001})
+            .build()
+        )
+        report = MemoryProfiler().profile_characters([hero])
+
+        self.assertGreater(
+            report["by_category"]["stats"],
+            sys.getsizeof(hero.stats) + 2 * sys.getsizeof(1000),
+        )
+
+    def test_failed_profile_stops_tracing(self):
+        """
+        Ensure tracemalloc isn't left running when loading fails.
+        """
+        self.assertRaises(
+            FileNotFoundError, lambda: MemoryProfiler().profile_file("missing.json")
+        )
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_profile_file_measures_load(self):
+        """
+        Ensure profiling a file reports the tracemalloc peak of the load path.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, "roster.json")
+            hero = CharacterBuilder().set_name("m1000").set_class("Wizard").build()
+            CharacterManager.save_characters([hero], file_name)
+            report = MemoryProfiler().profile_file(file_name)
+
+        self.assertGreater(report["load"]["peak"], 0)
+        self.assertGreaterEqual(report["load"]["peak"], report["load"]["retained"])
+        self.assertIn("Wizard", report["construction"])
+
+
+class StatRollerTestCase(unittest.TestCase):
+
+    def test_same_seed_rolls_same_batch(self):
+        """
+        Ensure a seeded roller is reproducible.
+        """
+        first = StatRoller(seed=42).roll(100)
+        second = StatRoller(seed=42).roll(100)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 600)
+        self.assertTrue(all(3 <= value <= 18 for value in first))
+
+    def test_point_buy_and_standard_lines_are_valid(self):
+        """
+        Ensure every rolled line follows the point-buy budget or the standard array.
+        """
+        roller = StatRoller(seed=1)
+        point_buy = roller.roll(50, "point-buy")
+        standard = roller.roll(50, "standard")
+
+        for i in range(0, 300, 6):
+            line = point_buy[i : i + 6]
+            self.assertEqual(
+                sum(POINT_BUY_COSTS[value] for value in line), POINT_BUY_BUDGET
+            )
+            self.assertEqual(sorted(standard[i : i + 6]), sorted(STANDARD_ARRAY))
+
+    def test_build_characters_uses_rolled_stats(self):
+        """
+        Ensure bulk built characters get their own stat line from the batch.
+        """
+        characters = StatRoller(seed=7).build_characters("Monk", 3, "standard")
+        buffer = StatRoller(seed=7).roll(3, "standard")
+
+        self.assertEqual(len(characters), 3)
+        self.assertEqual(characters[2]._name, "Monk3")
+        self.assertEqual(list(characters[1].stats.values()), list(buffer[6:12]))
+        self.assertRaises(ValueError, lambda: StatRoller().roll(1, "3d6"))
+
+
+class EncounterSimulatorTestCase(unittest.TestCase):
+
+    def setUp(self):
+        roller = StatRoller(seed=3)
+        self.party_a = roller.build_characters("Fighter", 2) + roller.build_characters(
+            "Wizard", 1
+        )
+        self.party_b = roller.build_characters("Rogue", 2)
+
+    def test_health_is_saved_and_loaded(self):
+        """
+        Ensure a character's health survives a save and load.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, "party.json")
+            self.party_a[0].health = 42
+            CharacterManager.save_characters(self.party_a, file_name)
+            loaded = CharacterManager.load_characters(file_name)
+
+        self.assertEqual(loaded[0].health, 42)
+        self.assertEqual(loaded[2].health, 80)
+
+    def test_modifier(self):
+        """
+        Ensure stat modifiers follow the usual table.
+        """
+        self.assertEqual(modifier(10), 0)
+        self.assertEqual(modifier(15), 2)
+        self.assertEqual(modifier(8), -1)
+
+    def test_negative_healing_does_not_hurt(self):
+        """
+        Ensure a heal with a negative modifier never lowers health.
+        """
+        ally = Combatant(("ally", "Fighter", 100, {}), 0, 0)
+        ally.hp = 1
+        ally.heal(-4)
+
+        self.assertEqual(ally.hp, 1)
+
+    def test_seeded_runs_are_reproducible(self):
+        """
+        Ensure the same seed gives the same results whatever the batch layout.
+        """
+        simulator = EncounterSimulator(self.party_a, self.party_b)
+        first = simulator.run(40, seed=11, workers=1, batch_size=10)
+        second = simulator.run(40, seed=11, workers=2, batch_size=10)
+
+        self.assertEqual(first, second)
+        self.assertEqual(sum(first["wins"].values()), 40)
+        self.assertEqual(len(first["combatants"]), 5)
+        low, high = first["win_rate_ci"]
+        self.assertLessEqual(low, first["win_rate"]["A"])
+        self.assertGreaterEqual(high, first["win_rate"]["A"])
+
+
+class CharacterHistoryTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.items = [Item(f"item{i}", "desc", i) for i in range(100)]
+        self.hero = (
+            CharacterBuilder()
+            .set_name("m1000")
+            .set_class("Wizard")
+            .set_inventory(list(self.items))
+            .build()
+        )
+        self.history = CharacterHistory(self.hero)
+
+    def test_shared_inventory_behaves_like_a_list(self):
+        """
+        Ensure random edits leave SharedInventory matching a plain list.
+        """
+        rng = random.Random(5)
+        expected = list(range(50))
+        inventory = SharedInventory(expected)
+        for _ in range(300):
+            index = rng.randrange(len(expected))
+            if rng.random() < 0.5:
+                expected.insert(index, -index)
+                inventory.insert(index, -index)
+            else:
+                del expected[index]
+                del inventory[index]
+
+        self.assertEqual(list(inventory), expected)
+        self.assertEqual(inventory[-1], expected[-1])
+
+    def test_undo_and_redo_restore_stats_and_inventory(self):
+        """
+        Ensure restoring versions brings back earlier stats and items.
+        """
+        self.hero.add_item_to_inventory(Item("rock", "a rock", 1))
+        self.hero.stats["STR"] = 18
+        self.hero.remove_item_from_inventory(self.items[0])
+        self.history.snapshot()
+
+        self.assertEqual(self.hero.stats["STR"], 18)
+        self.assertEqual(len(self.hero._inventory), 100)
+
+        self.history.undo()
+        self.assertEqual(self.hero.stats["STR"], 8)
+        self.assertEqual(list(self.hero._inventory), self.items)
+
+        self.history.redo()
+        self.assertEqual(self.hero._inventory[-1].name, "rock")
+        self.assertEqual(self.hero.to_dict()["inventory"][0]["name"], "item1")
+
+    def test_size_walkers_see_shared_inventory(self):
+        """
+        Ensure the profiler still counts items and tree nodes after attaching.
+        """
+        plain = (
+            CharacterBuilder()
+            .set_name("m1000")
+            .set_class("Wizard")
+            .set_inventory(list(self.items))
+            .build()
+        )
+        plain_report = MemoryProfiler().profile_characters([plain])
+        report = MemoryProfiler().profile_characters([self.hero])
+
+        self.assertEqual(
+            report["by_category"]["Item"], plain_report["by_category"]["Item"]
+        )
+        self.assertGreater(
+            report["by_category"]["inventory"],
+            plain_report["by_category"]["inventory"],
+        )
+
+    def test_snapshots_share_unchanged_structure(self):
+        """
+        Ensure a snapshot keeps pointing at its own version after later edits.
+        """
+        first = self.history[0]
+        self.hero.add_item_to_inventory(Item("rock", "a rock", 1))
+        self.history.snapshot()
+
+        self.assertEqual(len(first.inventory), 100)
+        self.assertEqual(len(self.history[1].inventory), 101)
+        self.assertIs(self.history[1].stats, first.stats)
+        with self.assertRaises(TypeError):
+            first.stats["STR"] = 1
+
+    def test_append_copies_only_one_path(self):
+        """
+        Ensure an append shares all but O(log n) tree nodes with the previous version.
+        """
+        old_nodes = {id(node) for node in self.hero._inventory.nodes()}
+        self.hero.add_item_to_inventory(Item("rock", "a rock", 1))
+        self.history.snapshot()
+
+        inventory = self.hero._inventory
+        new_nodes = [node for node in inventory.nodes() if id(node) not in old_nodes]
+        self.assertLessEqual(len(new_nodes), inventory._root.height + 1)
+        self.assertEqual(len(list(inventory.nodes())), 101)
+        self.assertEqual(len(self.history[0].inventory), 100)
+
+
+class SharedRosterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.roster = SharedRoster()
+        for i in range(4):
+            self.roster.build(f"ranger{i}", "Ranger", items=[])
+
+    def test_concurrent_updates_are_not_lost(self):
+        """
+        Ensure read-modify-write changes from many threads are all applied.
+        """
+
+        def add_health(char):
+            health = char.health
+            time.sleep(0)  # let other threads in between the read and the write
+            char.health = health + 1
+
+        def add_health_often():
+            for i in range(200):
+                self.roster.update(f"ranger{i % 4}", add_health)
+
+        threads = [threading.Thread(target=add_health_often) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for name in self.roster.names():
+            self.assertEqual(self.roster.get(name)["health"], 120 + 400)
+
+    def test_build_returns_a_copy(self):
+        """
+        Ensure build hands back data, not the live character in the roster.
+        """
+        built = self.roster.build("bard", "Bard")
+        built["stats"]["CHA"] = 1
+
+        self.assertEqual(self.roster.get("bard")["stats"]["CHA"], 15)
+
+    def test_update_after_remove_raises(self):
+        """
+        Ensure a write waiting on a character that gets removed is not applied.
+        """
+        entry = self.roster._entries["ranger0"]
+        errors = []
+
+        def update():
+            try:
+                self.roster.update("ranger0", lambda char: setattr(char, "health", 1))
+            except KeyError as e:
+                errors.append(e)
+
+        entry.lock.acquire_write()
+        updater = threading.Thread(target=update)
+        updater.start()
+        while not entry.lock._waiting_writers:
+            time.sleep(0.001)
+        remover = threading.Thread(target=lambda: self.roster.remove("ranger0"))
+        remover.start()
+        while "ranger0" in self.roster:
+            time.sleep(0.001)
+        entry.lock.release_write()
+        updater.join()
+        remover.join()
+
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(entry.character.health, 120)
+
+    def test_writer_waits_for_readers(self):
+        """
+        Ensure a writer cannot change a character while it is being read.
+        """
+        lock = ReadWriteLock()
+        events = []
+        lock.acquire_read()
+        writer = threading.Thread(
+            target=lambda: (lock.acquire_write(), events.append("write"))
+        )
+        writer.start()
+        writer.join(timeout=0.1)
+        events.append("read done")
+        lock.release_read()
+        writer.join()
+
+        self.assertEqual(events, ["read done", "write"])
+
+    def test_roster_membership(self):
+        """
+        Ensure duplicate names are rejected and removed characters are gone.
+        """
+        self.assertEqual(len(self.roster), 4)
+        self.assertRaises(ValueError, lambda: self.roster.build("ranger0", "Ranger"))
+        self.roster.remove("ranger0")
+        self.assertNotIn("ranger0", self.roster)
+        self.assertRaises(KeyError, lambda: self.roster.get("ranger0"))
+
+
 if __name__ == "__main__":
     unittest.main()